@@ -1,3 +1,6 @@
 class NormanAppConfig:
+    get_flags_initial_interval = 0.25 # seconds
     get_flags_interval = 5 # seconds
     flag_timeout_seconds = 1800 # 30 minutes
+    access_token_leeway_seconds = flag_timeout_seconds + 300 # flag wait plus 5 minutes for uploads
+    file_read_chunk_size = 1 << 20 # 1 MB
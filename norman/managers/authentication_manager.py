@@ -10,6 +10,8 @@ from norman_objects.services.authenticate.signup.signup_key_response import Sign
 from norman_objects.shared.security.sensitive import Sensitive
 from norman_utils_external.singleton import Singleton
 
+from norman._app_config import NormanAppConfig
+
 
 class AuthenticationManager(metaclass=Singleton):
     def __init__(self) -> None:
@@ -32,6 +34,10 @@ class AuthenticationManager(metaclass=Singleton):
         return self._account_id
 
     def set_api_key(self, api_key: str) -> None:
+        if api_key != self._api_key:
+            self._account_id = None
+            self._access_token = None
+            self._id_token = None
         self._api_key = api_key
 
     def access_token_expired(self) -> bool:
@@ -41,7 +47,7 @@ class AuthenticationManager(metaclass=Singleton):
             decoded = jwt.decode(self._access_token.value(), options={"verify_signature": False}) # we will add a jwks store to verify against in the near future.
             exp = decoded["exp"]
             now = datetime.now(timezone.utc).timestamp()
-            return exp < now
+            return exp - NormanAppConfig.access_token_leeway_seconds < now
         except Exception:
             return True
 
@@ -66,5 +72,5 @@ class AuthenticationManager(metaclass=Singleton):
             self._id_token = login_response.id_token
 
     async def invalidate_access_token(self) -> None:
-        if self.access_token_expired:
+        if self.access_token_expired():
             await self._login_with_api_key()
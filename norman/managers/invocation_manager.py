@@ -37,13 +37,14 @@ class InvocationManager:
 
     async def invoke(self, invocation_config: dict[str, Any]) -> dict[str, Any]:
         await self._authentication_manager.invalidate_access_token()
+        token = self._authentication_manager.access_token
         validated_invocation_config = InvocationConfigFactory.create(invocation_config)
 
         async with self._http_client:
-            invocation = await self._create_invocation_in_database(self._authentication_manager.access_token, validated_invocation_config)
-            await self._upload_inputs(self._authentication_manager.access_token, invocation, validated_invocation_config)
-            await self._wait_for_flags(self._authentication_manager.access_token, invocation)
-            output_handlers = await self._get_response_handlers(self._authentication_manager.access_token, invocation)
+            invocation = await self._create_invocation_in_database(token, validated_invocation_config)
+            await self._upload_inputs(token, invocation, validated_invocation_config)
+            await self._wait_for_flags(token, invocation)
+            output_handlers = await self._get_response_handlers(token, invocation)
             results = await self._resolve_outputs(validated_invocation_config, output_handlers)
 
         return results
@@ -33,13 +33,14 @@ class ModelUploadManager:
 
     async def upload_model(self, model_config: dict[str, Any]) -> Model:
         await self._authentication_manager.invalidate_access_token()
+        token = self._authentication_manager.access_token
         validated_model_config = ModelConfig.model_validate(model_config)
         model = ModelFactory.create(validated_model_config)
 
         async with self._http_client:
-            model = await self._create_model_in_database(self._authentication_manager.access_token, model)
-            await self._upload_assets(self._authentication_manager.access_token, model, validated_model_config)
-            await self._wait_for_flags(self._authentication_manager.access_token, model)
+            model = await self._create_model_in_database(token, model)
+            await self._upload_assets(token, model, validated_model_config)
+            await self._wait_for_flags(token, model)
             return model
 
     async def _create_model_in_database(self, token: Sensitive[str], model: Model) -> Model:
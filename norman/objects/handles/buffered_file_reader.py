@@ -0,0 +1,60 @@
+import asyncio
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+from norman._app_config import NormanAppConfig
+
+
+class BufferedFileReader:
+    def __init__(self, path: Union[str, Path], chunk_size: int = NormanAppConfig.file_read_chunk_size) -> None:
+        self._path = path
+        self._chunk_size = chunk_size
+        self._file: Optional[BinaryIO] = None
+        self._buffer = bytearray()
+
+    async def __aenter__(self) -> "BufferedFileReader":
+        loop = asyncio.get_running_loop()
+        self._file = await loop.run_in_executor(None, open, self._path, "rb", 0)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._buffer.clear()
+
+    def __aiter__(self) -> "BufferedFileReader":
+        return self
+
+    async def __anext__(self) -> bytes:
+        chunk = await self.read(self._chunk_size)
+        if len(chunk) == 0:
+            raise StopAsyncIteration
+        return chunk
+
+    async def read(self, size: int = -1) -> bytes:
+        if self._file is None:
+            raise ValueError("File is not open - use BufferedFileReader as an async context manager")
+
+        if size is None or size < 0:
+            remainder = await self._read_chunk(-1)
+            data = bytes(self._buffer) + remainder
+            self._buffer.clear()
+            return data
+
+        while len(self._buffer) < size:
+            chunk = await self._read_chunk(max(self._chunk_size, size - len(self._buffer)))
+            if len(chunk) == 0:
+                break
+            if len(self._buffer) == 0 and len(chunk) == size:
+                return chunk
+            self._buffer.extend(chunk)
+
+        with memoryview(self._buffer) as buffer_view:
+            data = bytes(buffer_view[:size])
+        del self._buffer[:size]
+        return data
+
+    async def _read_chunk(self, size: int) -> bytes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._file.read, size)
@@ -17,35 +17,41 @@ class FlagStatusResolver:
         self._timeout_seconds =  NormanAppConfig.flag_timeout_seconds
 
     async def wait_for_entities(self, token: Sensitive[str], entity_ids: Sequence[str]) -> None:
-        flag_constraints = QueryConstraints.includes("Status_Flags", "Entity_ID", list(entity_ids))
+        pending_entity_ids = set(entity_ids)
+        poll_interval = NormanAppConfig.get_flags_initial_interval
         wait_start_time = time.time()
         wait_end_time = wait_start_time + self._timeout_seconds
 
         while time.time() < wait_end_time:
             iteration_start_time = time.time()
 
+            flag_constraints = QueryConstraints.includes("Status_Flags", "Entity_ID", list(pending_entity_ids))
             status_flags = await self._persist_service.status_flags.get_status_flags(token, flag_constraints)
             if status_flags is None:
                 raise ValueError("No status flags found for entities")
 
-            flattened_flags = []
-            for flag_list in status_flags.values():
-                flattened_flags += flag_list
+            finished_entity_ids = set()
+            for entity_id, flag_list in status_flags.items():
+                entity_finished = len(flag_list) > 0
+                for status_flag in flag_list:
+                    if status_flag.flag_value == StatusFlagValue.Error:
+                        raise ValueError("Status flags at error state - One or more entities have failed")
+                    if status_flag.flag_value != StatusFlagValue.Finished:
+                        entity_finished = False
 
-            all_flags_finished = True
-            for status_flag in flattened_flags:
-                if status_flag.flag_value == StatusFlagValue.Error:
-                    raise ValueError("Status flags at error state - One or more entities have failed")
-                if status_flag.flag_value != StatusFlagValue.Finished:
-                    all_flags_finished = False
+                if entity_finished:
+                    finished_entity_ids.add(entity_id)
 
-            if all_flags_finished:
+            pending_entity_ids -= finished_entity_ids
+            if len(pending_entity_ids) == 0:
                 return
 
             loop_iteration_end = time.time()
             iteration_duration = loop_iteration_end - iteration_start_time
-            wait_time = NormanAppConfig.get_flags_interval - iteration_duration
+            wait_time = poll_interval - iteration_duration
             if wait_time > 0:
                 await asyncio.sleep(wait_time)
 
+            poll_interval = min(poll_interval * 2, NormanAppConfig.get_flags_interval)
+
         raise TimeoutError("Status flags did not finish - Timed out waiting for entities")
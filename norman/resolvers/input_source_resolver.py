@@ -1,4 +1,5 @@
 import asyncio
+import io
 from io import IOBase
 from pathlib import Path
 from typing import Any
@@ -8,9 +9,22 @@ from norman_objects.shared.inputs.input_source import InputSource
 
 
 class InputSourceResolver:
+    _Sync_Stream_Types = {
+        io.BufferedReader,
+        io.BufferedWriter,
+        io.BytesIO,
+        io.FileIO,
+        io.StringIO
+    }
+
     @staticmethod
     def resolve(data: Any) -> InputSource:
-        if data is None:
+        data_type = type(data)
+        if data_type is str:
+            return InputSourceResolver._resolve_string(data)
+        elif data_type is bytes or data_type is bytearray:
+            return InputSource.Primitive
+        elif data is None:
             raise ValueError("Input data cannot be None")
         elif isinstance(data, Path):
             if data.exists():
@@ -22,21 +36,29 @@ class InputSourceResolver:
         elif InputSourceResolver._is_sync_stream(data):
             return InputSource.Stream
         elif isinstance(data, str):
-            stripped = data.strip()
+            return InputSourceResolver._resolve_string(data)
+        else:
+            return InputSource.Primitive
 
-            if InputSourceResolver._is_url(stripped):
-                return InputSource.Link
+    @staticmethod
+    def _resolve_string(data: str) -> InputSource:
+        stripped = data.strip()
 
-            path = Path(stripped)
-            if path.exists():
-                return InputSource.File
+        if InputSourceResolver._is_url(stripped):
+            return InputSource.Link
 
-            return InputSource.Primitive
-        else:
-            return InputSource.Primitive
+        path = Path(stripped)
+        if path.exists():
+            return InputSource.File
+
+        return InputSource.Primitive
 
     @staticmethod
     def _is_url(data: str):
+        prefix = data[:8].lower()
+        if not prefix.startswith(("http://", "https://")):
+            return False
+
         parsed = urlparse(data)
         if parsed.scheme not in ["http", "https"]:
             return False
@@ -47,6 +69,9 @@ class InputSourceResolver:
 
     @staticmethod
     def _is_sync_stream(obj: Any) -> bool:
+        if type(obj) in InputSourceResolver._Sync_Stream_Types:
+            return True
+
         if isinstance(obj, IOBase):
             return True
 
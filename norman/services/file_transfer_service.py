@@ -3,7 +3,6 @@ import json
 from pathlib import Path
 from typing import Any, Union
 
-import aiofiles
 from norman_core.clients.socket_client import SocketClient
 from norman_core.services.file_push.file_push import FilePush
 from norman_objects.services.file_push.checksum.checksum_request import ChecksumRequest
@@ -12,13 +11,48 @@ from norman_objects.services.file_push.pairing.socket_input_pairing_request impo
 from norman_objects.shared.security.sensitive import Sensitive
 from norman_utils_external.singleton import Singleton
 
+from norman.objects.handles.buffered_file_reader import BufferedFileReader
+
+
+def _normalize_text(data: str) -> io.BytesIO:
+    return io.BytesIO(data.encode("utf-8"))
+
+
+def _normalize_bytes(data: Union[bytes, bytearray]) -> io.BytesIO:
+    return io.BytesIO(data)
+
+
+def _normalize_buffer(data: io.BytesIO) -> io.BytesIO:
+    return data
+
+
+def _normalize_number(data: Union[int, float]) -> io.BytesIO:
+    return io.BytesIO(str(data).encode("utf-8"))
+
+
+def _normalize_json(data: Union[dict, list]) -> io.BytesIO:
+    json_str = json.dumps(data)
+    return io.BytesIO(json_str.encode("utf-8"))
+
+
+_Primitive_Normalizers = {
+    str: _normalize_text,
+    bytes: _normalize_bytes,
+    bytearray: _normalize_bytes,
+    io.BytesIO: _normalize_buffer,
+    int: _normalize_number,
+    float: _normalize_number,
+    dict: _normalize_json,
+    list: _normalize_json
+}
+
 
 class FileTransferService(metaclass=Singleton):
     def __init__(self) -> None:
         self._file_push_service = FilePush()
 
     async def upload_file(self, token: Sensitive[str], pairing_request: Union[SocketAssetPairingRequest, SocketInputPairingRequest], path: Union[str, Path]) -> None:
-        async with aiofiles.open(path, mode="rb") as file:
+        async with BufferedFileReader(path) as file:
             await self.upload_from_buffer(token, pairing_request, file)
 
     async def upload_from_buffer(self, token: Sensitive[str], pairing_request: Union[SocketAssetPairingRequest, SocketInputPairingRequest], buffer: Union[bytes, io.BytesIO]) -> None:
@@ -34,21 +68,24 @@ class FileTransferService(metaclass=Singleton):
         await self._file_push_service.complete_file_transfer(token, checksum_request)
 
     def normalize_primitive_data(self, data: Any) -> io.BytesIO:
+        normalizer = _Primitive_Normalizers.get(type(data))
+        if normalizer is not None:
+            return normalizer(data)
+
         if isinstance(data, str):
-            return io.BytesIO(data.encode("utf-8"))
+            return _normalize_text(data)
 
         elif isinstance(data, (bytes, bytearray)):
-            return io.BytesIO(data)
+            return _normalize_bytes(data)
 
         elif isinstance(data, io.BytesIO):
-            return data
+            return _normalize_buffer(data)
 
         elif isinstance(data, (int, float)):
-            return io.BytesIO(str(data).encode("utf-8"))
+            return _normalize_number(data)
 
         elif isinstance(data, (dict, list)):
-            json_str = json.dumps(data)
-            return io.BytesIO(json_str.encode("utf-8"))
+            return _normalize_json(data)
 
         else:
             raise ValueError(f"Unsupported data type: {type(data)}. Cannot convert to BytesIO.")